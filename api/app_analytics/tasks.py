@@ -39,26 +39,19 @@ if settings.USE_POSTGRES_FOR_ANALYTICS:
     run_every=timedelta(days=1),
 )
 def clean_up_old_analytics_data():
+    now = timezone.now()
+
     # delete raw analytics data older than `RAW_ANALYTICS_DATA_RETENTION_DAYS`
-    APIUsageRaw.objects.filter(
-        created_at__lt=timezone.now()
-        - timedelta(days=settings.RAW_ANALYTICS_DATA_RETENTION_DAYS)
-    ).delete()
-    FeatureEvaluationRaw.objects.filter(
-        created_at__lt=timezone.now()
-        - timedelta(days=settings.RAW_ANALYTICS_DATA_RETENTION_DAYS)
-    ).delete()
+    raw_data_cutoff = now - timedelta(days=settings.RAW_ANALYTICS_DATA_RETENTION_DAYS)
+    APIUsageRaw.objects.filter(created_at__lt=raw_data_cutoff).delete()
+    FeatureEvaluationRaw.objects.filter(created_at__lt=raw_data_cutoff).delete()
 
     # delete bucketed analytics data older than `BUCKETED_ANALYTICS_DATA_RETENTION_DAYS`
-    APIUsageBucket.objects.filter(
-        created_at__lt=timezone.now()
-        - timedelta(days=settings.BUCKETED_ANALYTICS_DATA_RETENTION_DAYS)
-    ).delete()
-
-    FeatureEvaluationBucket.objects.filter(
-        created_at__lt=timezone.now()
-        - timedelta(days=settings.BUCKETED_ANALYTICS_DATA_RETENTION_DAYS)
-    ).delete()
+    bucketed_data_cutoff = now - timedelta(
+        days=settings.BUCKETED_ANALYTICS_DATA_RETENTION_DAYS
+    )
+    APIUsageBucket.objects.filter(created_at__lt=bucketed_data_cutoff).delete()
+    FeatureEvaluationBucket.objects.filter(created_at__lt=bucketed_data_cutoff).delete()
 
 
 @register_task_handler()
@@ -1,10 +1,12 @@
 from __future__ import unicode_literals
 
+import bisect
 import datetime
 import logging
 import typing
 import uuid
 from copy import deepcopy
+from itertools import accumulate
 
 from core.models import (
     AbstractBaseExportableModel,
@@ -664,24 +666,25 @@ class FeatureState(
         # the multivariate_feature_state_values should be prefetched at this point
         # so we just convert them to a list and use python operations from here to
         # avoid further queries to the DB
-        mv_options = list(self.multivariate_feature_state_values.all())
+        mv_options = sorted(
+            self.multivariate_feature_state_values.all(), key=lambda o: o.id
+        )
 
         percentage_value = (
             get_hashed_percentage_for_object_ids([self.id, identity_hash_key]) * 100
         )
 
-        # Iterate over the mv options in order of id (so we get the same value each
-        # time) to determine the correct value to return to the identity based on
-        # the percentage allocations of the multivariate options. This gives us a
+        # Using the mv options in order of id (so we get the same value each time),
+        # build the cumulative percentage allocations and find the first option
+        # whose upper limit is greater than the percentage value. This gives us a
         # way to ensure that the same value is returned every time we use the same
         # percentage value.
-        start_percentage = 0
-        for mv_option in sorted(mv_options, key=lambda o: o.id):
-            limit = getattr(mv_option, "percentage_allocation", 0) + start_percentage
-            if start_percentage <= percentage_value < limit:
-                return mv_option.multivariate_feature_option
-
-            start_percentage = limit
+        limits = list(
+            accumulate(getattr(o, "percentage_allocation", 0) for o in mv_options)
+        )
+        index = bisect.bisect_right(limits, percentage_value)
+        if index < len(mv_options):
+            return mv_options[index].multivariate_feature_option
 
         # if none of the percentage allocations match the percentage value we got for
         # the identity, then we just return the default feature state value (or None
@@ -2,6 +2,7 @@
 from __future__ import unicode_literals
 
 from django.conf import settings
+from django.core.cache import cache
 from django.utils.decorators import method_decorator
 from drf_yasg import openapi
 from drf_yasg.utils import no_body, swagger_auto_schema
@@ -48,6 +49,9 @@ from projects.serializers import (
     ProjectUpdateOrCreateSerializer,
 )
 
+PROJECT_PERMISSIONS_CACHE_KEY = "project_permissions"
+PROJECT_PERMISSIONS_CACHE_TTL = 60 * 60
+
 
 @method_decorator(
     name="list",
@@ -91,15 +95,19 @@ class ProjectViewSet(viewsets.ModelViewSet):
 
         queryset = self.request.user.get_permitted_projects(permission_key=VIEW_PROJECT)
 
+        filters = {}
+
         organisation_id = self.request.query_params.get("organisation")
         if organisation_id:
-            queryset = queryset.filter(organisation__id=organisation_id)
+            filters["organisation__id"] = organisation_id
 
         project_uuid = self.request.query_params.get("uuid")
         if project_uuid:
-            queryset = queryset.filter(uuid=project_uuid)
+            filters["uuid"] = project_uuid
 
-        return queryset
+        # the organisation is needed to check object permissions (e.g. whether
+        # the user is an organisation admin) so we fetch it up front.
+        return queryset.filter(**filters).select_related("organisation")
 
     def perform_create(self, serializer):
         project = serializer.save()
@@ -130,11 +138,16 @@ class ProjectViewSet(viewsets.ModelViewSet):
     )
     @action(detail=False, methods=["GET"])
     def permissions(self, *args, **kwargs):
-        return Response(
-            PermissionModelSerializer(
+        # permission models are only ever added by migrations, so we can safely
+        # cache the serialized data rather than querying it on every request.
+        data = cache.get_or_set(
+            PROJECT_PERMISSIONS_CACHE_KEY,
+            lambda: PermissionModelSerializer(
                 instance=ProjectPermissionModel.objects.all(), many=True
-            ).data
+            ).data,
+            PROJECT_PERMISSIONS_CACHE_TTL,
         )
+        return Response(data)
 
     @swagger_auto_schema(responses={200: UserObjectPermissionsSerializer()})
     @action(
@@ -171,9 +184,14 @@ class ProjectViewSet(viewsets.ModelViewSet):
         if project.is_too_large:
             raise ProjectTooLargeError()
 
-        identity_count = Identity.objects.filter(environment__project=project).count()
+        # We only need to know whether the limit has been exceeded, so we slice
+        # the queryset to avoid counting every identity in large projects.
+        max_identities = settings.MAX_SELF_MIGRATABLE_IDENTITIES
+        identity_count = Identity.objects.filter(environment__project=project)[
+            : max_identities + 1
+        ].count()
 
-        if identity_count > settings.MAX_SELF_MIGRATABLE_IDENTITIES:
+        if identity_count > max_identities:
             raise TooManyIdentitiesError()
 
         identity_migrator = IdentityMigrator(project.id)
@@ -156,6 +156,29 @@ def test_can_list_project_permission(client, project):
     )  # hard code how many permissions we expect there to be
 
 
+def test_list_project_permissions_is_cached(
+    admin_client: APIClient,
+    project: Project,
+    reset_cache: None,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    url = reverse("api-v1:projects:project-permissions")
+    first_response = admin_client.get(url)
+
+    mocked_project_permission_model = mocker.patch(
+        "projects.views.ProjectPermissionModel"
+    )
+
+    # When
+    response = admin_client.get(url)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == first_response.json()
+    mocked_project_permission_model.objects.all.assert_not_called()
+
+
 def test_my_permissions_for_a_project_return_400_with_master_api_key(
     admin_master_api_key_client, project, organisation
 ):